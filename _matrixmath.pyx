@@ -0,0 +1,82 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled versions of the MatrixMath helpers from main.py
+
+Matrices use the same (a, b, tx, c, d, ty) tuple layout as the pure-Python
+MatrixMath class. Build in place with: python setup.py build_ext --inplace
+"""
+
+from libc.math cimport cos, sin
+
+
+cpdef tuple create_translation_matrix(double dx, double dy):
+    """Create a 2D translation matrix"""
+    return (1.0, 0.0, dx, 0.0, 1.0, dy)
+
+
+cpdef tuple create_scale_matrix(double sx, double sy):
+    """Create a 2D scaling matrix"""
+    return (sx, 0.0, 0.0, 0.0, sy, 0.0)
+
+
+cpdef tuple create_rotation_matrix(double angle):
+    """Create a 2D rotation matrix (angle in radians)"""
+    cdef double cos_a = cos(angle)
+    cdef double sin_a = sin(angle)
+    return (cos_a, -sin_a, 0.0, sin_a, cos_a, 0.0)
+
+
+cpdef list apply_transformation(tuple matrix, point):
+    """Apply transformation matrix to a point"""
+    cdef double a, b, tx, c, d, ty
+    cdef double x = point[0]
+    cdef double y = point[1]
+    a, b, tx, c, d, ty = matrix
+    return [a * x + b * y + tx, c * x + d * y + ty]
+
+
+cdef tuple _multiply(tuple m, tuple n):
+    cdef double a1, b1, tx1, c1, d1, ty1
+    cdef double a2, b2, tx2, c2, d2, ty2
+    a1, b1, tx1, c1, d1, ty1 = m
+    a2, b2, tx2, c2, d2, ty2 = n
+    return (a1 * a2 + b1 * c2, a1 * b2 + b1 * d2, a1 * tx2 + b1 * ty2 + tx1,
+            c1 * a2 + d1 * c2, c1 * b2 + d1 * d2, c1 * tx2 + d1 * ty2 + ty1)
+
+
+def combine_matrices(*matrices):
+    """Combine multiple transformation matrices"""
+    cdef tuple result = matrices[0]
+    cdef tuple matrix
+    for matrix in matrices[1:]:
+        result = _multiply(result, matrix)
+    return result
+
+
+cpdef double lerp(double start, double end, double t):
+    """Linear interpolation between two values"""
+    return start + t * (end - start)
+
+
+cpdef tuple lerp_matrix(tuple matrix_a, tuple matrix_b, double t):
+    """Linear interpolation between two matrices"""
+    cdef double a1, b1, tx1, c1, d1, ty1
+    cdef double a2, b2, tx2, c2, d2, ty2
+    a1, b1, tx1, c1, d1, ty1 = matrix_a
+    a2, b2, tx2, c2, d2, ty2 = matrix_b
+    return (a1 + t * (a2 - a1), b1 + t * (b2 - b1), tx1 + t * (tx2 - tx1),
+            c1 + t * (c2 - c1), d1 + t * (d2 - d1), ty1 + t * (ty2 - ty1))
+
+
+cpdef tuple create_view_matrix(double camera_x, double camera_y, double zoom=1.0):
+    """Create a view matrix for camera transformation"""
+    return (zoom, 0.0, -zoom * camera_x, 0.0, zoom, -zoom * camera_y)
+
+
+cpdef tuple invert_matrix(tuple matrix):
+    """Invert an affine transformation matrix"""
+    cdef double a, b, tx, c, d, ty, det, inv_a, inv_b, inv_c, inv_d
+    a, b, tx, c, d, ty = matrix
+    det = a * d - b * c
+    inv_a, inv_b, inv_c, inv_d = d / det, -b / det, -c / det, a / det
+    return (inv_a, inv_b, -(inv_a * tx + inv_b * ty),
+            inv_c, inv_d, -(inv_c * tx + inv_d * ty))
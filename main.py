@@ -1,12 +1,122 @@
 import pygame
+import collections
+import functools
 import math
-import random
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below also run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import _matrixmath
+except ImportError:  # compiled MatrixMath is optional; build it with setup.py
+    _matrixmath = None
+
+
+# Platform kinds as stored in the last column of the collision array
+PLATFORM_STATIC = 0
+PLATFORM_HORIZONTAL = 1
+PLATFORM_VERTICAL = 2
+PLATFORM_CIRCULAR = 3
+
+# Platform face hit by the ball, as reported by push_out_of_rect
+SIDE_NONE = 0
+SIDE_TOP = 1
+SIDE_BOTTOM = 2
+SIDE_LEFT = 3
+SIDE_RIGHT = 4
+
+MOVE_TYPE_CODES = {
+    None: PLATFORM_STATIC,
+    'horizontal': PLATFORM_HORIZONTAL,
+    'vertical': PLATFORM_VERTICAL,
+    'circular': PLATFORM_CIRCULAR,
+}
+
+# Sine lookup table for cosmetic waves; index with int(angle * SIN_TABLE_SCALE) & SIN_TABLE_MASK
+SIN_TABLE_SIZE = 256
+SIN_TABLE_MASK = SIN_TABLE_SIZE - 1
+SIN_TABLE_SCALE = SIN_TABLE_SIZE / (2 * math.pi)
+SIN_TABLE = [math.sin(i / SIN_TABLE_SCALE) for i in range(SIN_TABLE_SIZE)]
+
+BACKGROUND_COLOR = (50, 50, 100)
+
+# Scaled copies of the flag image kept around, keyed by pixel size
+FLAG_SCALE_CACHE_SIZE = 32
+# Halving steps pre-scaled from the flag image; downscales start from the nearest one
+FLAG_MIP_LEVELS = 5
+
+# Screen-space slack in pixels around the view before entities are culled from drawing
+CULL_MARGIN = 100
+
+# Entities smaller than this on screen are not drawn
+MIN_PIXEL_SIZE = 1.0
+
+# Moving-platform arrow shapes are cached per 1/ARROW_ZOOM_BINS step of zoom
+ARROW_ZOOM_BINS = 16
+
+# The camera settles on its target once this close, so a still scene keeps the same view matrix
+CAMERA_POSITION_EPSILON = 0.05
+CAMERA_ZOOM_EPSILON = 1e-4
+
+# Screen shake reads from a prefilled ring of noise; the size must be a power of two
+SHAKE_NOISE_SIZE = 4096
+SHAKE_NOISE_MASK = SHAKE_NOISE_SIZE - 1
+
+
+@functools.lru_cache(maxsize=128)
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface while the string is unchanged"""
+    return font.render(text, True, color)
+
+
+@functools.lru_cache(maxsize=256)
+def arrow_template(zoom_bin, move_type):
+    """Arrow triangles as (x0, y0, x1, y1, x2, y2) offsets from a platform centre, plus a ring radius"""
+    size = 8 * zoom_bin
+    if move_type == 'horizontal':
+        return ((-size, -(size // 2), -size * 1.5, 0, -size, size // 2),
+                (size, -(size // 2), size * 1.5, 0, size, size // 2)), 0
+    if move_type == 'vertical':
+        return ((-(size // 2), -size, 0, -size * 1.5, size // 2, -size),
+                (-(size // 2), size, 0, size * 1.5, size // 2, size)), 0
+    if move_type == 'circular':
+        return ((size * 0.7, -size * 0.7, size * 1.2, -size * 0.3, size * 0.9, -size * 0.9),), int(size)
+    return (), 0
+
+
+def write_triangle(pool, index, x0, y0, x1, y1, x2, y2):
+    """Overwrite triangle index of a reusable vertex pool in place, growing the pool if needed"""
+    if index == len(pool):
+        pool.append([[0, 0], [0, 0], [0, 0]])
+    a, b, c = pool[index]
+    a[0], a[1] = x0, y0
+    b[0], b[1] = x1, y1
+    c[0], c[1] = x2, y2
+    return index + 1
+
+
+def ease_toward(current, target, speed, epsilon):
+    """Lerp current toward target, snapping onto it once a step lands within epsilon and holding there"""
+    if abs(target - current) < epsilon:
+        return current
+    value = MatrixMath.lerp(current, target, speed)
+    return target if abs(target - value) < epsilon else value
+
 
 class Camera:
     """Advanced camera system using matrix transformations and linear interpolation"""
 
+    __slots__ = ('screen_width', 'screen_height', 'position', 'target_position', 'zoom', 'target_zoom',
+                 'shake_intensity', 'shake_timer', '_noise', '_noise_index', 'position_lerp_speed',
+                 'zoom_lerp_speed', 'min_x', 'max_x', 'view_matrix', 'previous_matrix', '_view_key',
+                 '_view_linear', '_view_offset')
+
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -20,6 +130,8 @@ class Camera:
         self.target_zoom = 1.0
         self.shake_intensity = 0.0
         self.shake_timer = 0
+        self._noise = np.random.uniform(-1.0, 1.0, SHAKE_NOISE_SIZE).tolist()
+        self._noise_index = 0
 
 
         self.position_lerp_speed = 0.08
@@ -31,7 +143,16 @@ class Camera:
 
 
         self.view_matrix = MatrixMath.create_view_matrix(0, 0, 1)
-        self.previous_matrix = self.view_matrix.copy()
+        self.previous_matrix = self.view_matrix
+        self._view_key = (0, 0, 1)
+        self._set_batch_transform()
+
+    def _set_batch_transform(self):
+        """Cache the view matrix as float32 arrays for world_to_screen_batch"""
+        a, b, tx, c, d, ty = self.view_matrix
+        # Transposed so row-vector points can be multiplied on the left
+        self._view_linear = np.array([[a, c], [b, d]], dtype=np.float32)
+        self._view_offset = np.array([tx, ty], dtype=np.float32)
 
     def set_target(self, target_x, target_y):
         """Set the camera target position"""
@@ -55,21 +176,25 @@ class Camera:
     def update(self):
         """Update camera using linear interpolation and matrix transformations"""
 
-        self.previous_matrix = self.view_matrix.copy()
+        self.previous_matrix = self.view_matrix
 
 
-        self.position[0] = MatrixMath.lerp(self.position[0], self.target_position[0], self.position_lerp_speed)
-        self.position[1] = MatrixMath.lerp(self.position[1], self.target_position[1], self.position_lerp_speed)
+        self.position[0] = ease_toward(self.position[0], self.target_position[0], self.position_lerp_speed,
+                                       CAMERA_POSITION_EPSILON)
+        self.position[1] = ease_toward(self.position[1], self.target_position[1], self.position_lerp_speed,
+                                       CAMERA_POSITION_EPSILON)
 
 
-        self.zoom = MatrixMath.lerp(self.zoom, self.target_zoom, self.zoom_lerp_speed)
+        self.zoom = ease_toward(self.zoom, self.target_zoom, self.zoom_lerp_speed, CAMERA_ZOOM_EPSILON)
 
 
         shake_offset_x = 0
         shake_offset_y = 0
         if self.shake_timer > 0:
-            shake_offset_x = random.uniform(-self.shake_intensity, self.shake_intensity)
-            shake_offset_y = random.uniform(-self.shake_intensity, self.shake_intensity)
+            i = self._noise_index
+            shake_offset_x = self._noise[i & SHAKE_NOISE_MASK] * self.shake_intensity
+            shake_offset_y = self._noise[(i + 1) & SHAKE_NOISE_MASK] * self.shake_intensity
+            self._noise_index = i + 2
             self.shake_timer -= 1
             if self.shake_timer <= 0:
                 self.shake_intensity = 0
@@ -78,12 +203,21 @@ class Camera:
         final_x = self.position[0] + shake_offset_x
         final_y = self.position[1] + shake_offset_y
 
-        self.view_matrix = MatrixMath.create_view_matrix(final_x, final_y, self.zoom)
+        # Only rebuild the view matrix when the camera has actually moved
+        view_key = (final_x, final_y, self.zoom)
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self.view_matrix = MatrixMath.create_view_matrix(final_x, final_y, self.zoom)
+            self._set_batch_transform()
 
     def world_to_screen(self, world_pos):
         """Transform world coordinates to screen coordinates using view matrix"""
         return MatrixMath.apply_transformation(self.view_matrix, world_pos)
 
+    def world_to_screen_batch(self, points):
+        """Transform an (..., 2) array of world points to screen coordinates in one call"""
+        return points.astype(np.float32, copy=False) @ self._view_linear + self._view_offset
+
     def screen_to_world(self, screen_pos):
         """Transform screen coordinates to world coordinates"""
 
@@ -92,6 +226,19 @@ class Camera:
         inverse_view = MatrixMath.combine_matrices(inv_translation, inv_scaling)
         return MatrixMath.apply_transformation(inverse_view, screen_pos)
 
+    def get_visible_world_bounds(self, margin=0):
+        """World-space AABB (min_x, min_y, max_x, max_y) of the screen padded by margin pixels"""
+        inverse_view = MatrixMath.invert_matrix(self.view_matrix)
+        left, top = -margin, -margin
+        right, bottom = self.screen_width + margin, self.screen_height + margin
+        xs = []
+        ys = []
+        for corner in ((left, top), (right, top), (right, bottom), (left, bottom)):
+            x, y = MatrixMath.apply_transformation(inverse_view, corner)
+            xs.append(x)
+            ys.append(y)
+        return min(xs), min(ys), max(xs), max(ys)
+
     def get_interpolated_matrix(self, alpha):
         """Get interpolated matrix for smooth rendering between frames"""
         return MatrixMath.lerp_matrix(self.previous_matrix, self.view_matrix, alpha)
@@ -100,50 +247,46 @@ class Camera:
 
 
 class MatrixMath:
-    """Custom matrix mathematics class for transformations"""
+    """Custom matrix mathematics class for transformations
+
+    A 2D affine matrix [[a, b, tx], [c, d, ty], [0, 0, 1]] is stored as the
+    tuple (a, b, tx, c, d, ty); the constant bottom row is implied.
+    """
 
     @staticmethod
     def create_translation_matrix(dx, dy):
         """Create a 2D translation matrix"""
-        return np.array([
-            [1, 0, dx],
-            [0, 1, dy],
-            [0, 0, 1]
-        ], dtype=float)
+        return (1.0, 0.0, dx, 0.0, 1.0, dy)
 
     @staticmethod
     def create_scale_matrix(sx, sy):
         """Create a 2D scaling matrix"""
-        return np.array([
-            [sx, 0, 0],
-            [0, sy, 0],
-            [0, 0, 1]
-        ], dtype=float)
+        return (sx, 0.0, 0.0, 0.0, sy, 0.0)
 
     @staticmethod
     def create_rotation_matrix(angle):
         """Create a 2D rotation matrix (angle in radians)"""
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
-        return np.array([
-            [cos_a, -sin_a, 0],
-            [sin_a, cos_a, 0],
-            [0, 0, 1]
-        ], dtype=float)
+        return (cos_a, -sin_a, 0.0, sin_a, cos_a, 0.0)
 
     @staticmethod
     def apply_transformation(matrix, point):
         """Apply transformation matrix to a point"""
-        homogeneous_point = np.array([point[0], point[1], 1])
-        transformed = np.dot(matrix, homogeneous_point)
-        return [transformed[0], transformed[1]]
+        a, b, tx, c, d, ty = matrix
+        x = point[0]
+        y = point[1]
+        return [a * x + b * y + tx, c * x + d * y + ty]
 
     @staticmethod
     def combine_matrices(*matrices):
         """Combine multiple transformation matrices"""
         result = matrices[0]
         for matrix in matrices[1:]:
-            result = np.dot(result, matrix)
+            a1, b1, tx1, c1, d1, ty1 = result
+            a2, b2, tx2, c2, d2, ty2 = matrix
+            result = (a1 * a2 + b1 * c2, a1 * b2 + b1 * d2, a1 * tx2 + b1 * ty2 + tx1,
+                      c1 * a2 + d1 * c2, c1 * b2 + d1 * d2, c1 * tx2 + d1 * ty2 + ty1)
         return result
 
     @staticmethod
@@ -154,18 +297,38 @@ class MatrixMath:
     @staticmethod
     def lerp_matrix(matrix_a, matrix_b, t):
         """Linear interpolation between two matrices"""
-        return matrix_a + t * (matrix_b - matrix_a)
+        return tuple(a + t * (b - a) for a, b in zip(matrix_a, matrix_b))
+
+    @staticmethod
+    def invert_matrix(matrix):
+        """Invert an affine transformation matrix"""
+        a, b, tx, c, d, ty = matrix
+        det = a * d - b * c
+        inv_a, inv_b, inv_c, inv_d = d / det, -b / det, -c / det, a / det
+        return (inv_a, inv_b, -(inv_a * tx + inv_b * ty),
+                inv_c, inv_d, -(inv_c * tx + inv_d * ty))
 
     @staticmethod
     def create_view_matrix(camera_x, camera_y, zoom=1.0):
         """Create a view matrix for camera transformation"""
 
-        translation = MatrixMath.create_translation_matrix(-camera_x, -camera_y)
-        scaling = MatrixMath.create_scale_matrix(zoom, zoom)
-        return MatrixMath.combine_matrices(scaling, translation)
+        # Closed form of combine_matrices(scaling, translation)
+        return (zoom, 0.0, -zoom * camera_x, 0.0, zoom, -zoom * camera_y)
+
+
+if _matrixmath is not None:
+    # Swap in the Cython implementations, keeping the MatrixMath interface
+    for _name in ('create_translation_matrix', 'create_scale_matrix', 'create_rotation_matrix',
+                  'apply_transformation', 'combine_matrices', 'lerp', 'lerp_matrix', 'invert_matrix',
+                  'create_view_matrix'):
+        setattr(MatrixMath, _name, staticmethod(getattr(_matrixmath, _name)))
 
 
 class PowerUp:
+    __slots__ = ('x', 'y', 'power_type', 'width', 'height', 'collected', 'color')
+
+    _sprite_cache = {}
+
     def __init__(self, x, y, power_type):
         self.x = x
         self.y = y
@@ -175,21 +338,42 @@ class PowerUp:
         self.collected = False
         self.color = (255, 0, 255) if power_type == 'grow' else (0, 255, 255)
 
-    def draw(self, screen):
-        if not self.collected:
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def get_sprite(self, width, height):
+        """Return a cached pre-rendered powerup of the given pixel size"""
+        key = (self.power_type, width, height)
+        sprite = PowerUp._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height))
+            sprite.fill(self.color)
 
+            line_len = width * 0.3
+            center_x, center_y = width / 2, height / 2
             if self.power_type == 'grow':
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.x + 10, self.y + 5), (self.x + 10, self.y + 15), 2)
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.x + 5, self.y + 10), (self.x + 15, self.y + 10), 2)
-            else:
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.x + 5, self.y + 10), (self.x + 15, self.y + 10), 2)
+                pygame.draw.line(sprite, (255, 255, 255),
+                                 (center_x, center_y - line_len), (center_x, center_y + line_len), 2)
+            pygame.draw.line(sprite, (255, 255, 255),
+                             (center_x - line_len, center_y), (center_x + line_len, center_y), 2)
+            PowerUp._sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        if not self.collected:
+            screen.blit(self.get_sprite(self.width, self.height), (self.x, self.y))
 
 
 class Coin:
+    __slots__ = ('x', 'y', 'radius', 'collected', 'rotation')
+
+    # Unit-circle octagon, rotated and scaled per frame instead of calling trig per vertex
+    UNIT_OCTAGON = np.stack([np.cos(np.arange(8) * math.pi / 4), np.sin(np.arange(8) * math.pi / 4)],
+                            axis=1).astype(np.float32)
+
+    # The octagon repeats every 1/8 turn, so sprites are cached for this many steps of that span
+    SPRITE_ROTATION_STEPS = 16
+    SPRITE_STEPS_PER_RADIAN = SPRITE_ROTATION_STEPS / (math.pi / 4)
+
+    _sprite_cache = {}
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -200,28 +384,53 @@ class Coin:
     def update(self):
         self.rotation += 0.1
 
+    @staticmethod
+    def render_sprites(radius):
+        """Render one coin sprite per rotation step, generating every octagon in one batch"""
+        center = radius + 1
+        angles = np.arange(Coin.SPRITE_ROTATION_STEPS) / Coin.SPRITE_STEPS_PER_RADIAN
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        rotations = np.array([[cos_a, sin_a], [-sin_a, cos_a]]).transpose(2, 0, 1)
+        octagons = center + radius * (Coin.UNIT_OCTAGON @ rotations)
+
+        sprites = []
+        for vertices in octagons.tolist():
+            sprite = pygame.Surface((2 * center + 1, 2 * center + 1), pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, (255, 255, 0), vertices)
+            pygame.draw.circle(sprite, (255, 215, 0), (center, center), max(1, int(radius * 0.7)))
+            sprites.append(sprite)
+        return sprites
+
+    def get_sprite(self, radius):
+        """Return a cached pre-rendered coin of the given pixel radius at the current rotation"""
+        radius = max(1, round(radius))
+        sprites = Coin._sprite_cache.get(radius)
+        if sprites is None:
+            sprites = Coin._sprite_cache[radius] = Coin.render_sprites(radius)
+        return sprites[int(self.rotation * Coin.SPRITE_STEPS_PER_RADIAN) % Coin.SPRITE_ROTATION_STEPS]
+
     def draw(self, screen):
         if not self.collected:
-
-            angle = self.rotation
-            vertices = []
-            for i in range(8):
-                vertex_angle = (i * math.pi * 2 / 8) + angle
-                x = self.x + math.cos(vertex_angle) * self.radius
-                y = self.y + math.sin(vertex_angle) * self.radius
-                vertices.append((x, y))
-
-            pygame.draw.polygon(screen, (255, 255, 0), vertices)
-            pygame.draw.circle(screen, (255, 215, 0), (int(self.x), int(self.y)), self.radius - 3)
+            sprite = self.get_sprite(self.radius)
+            screen.blit(sprite, sprite.get_rect(center=(int(self.x), int(self.y))))
 
 
 class Platform:
+    __slots__ = ('x', 'y', 'width', 'height', 'rect', 'velocity', 'move_type', 'local_corners')
+
     def __init__(self, x, y, width, height):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.rect = pygame.Rect(x, y, width, height)
+        # Corners relative to the top-left; the size never changes, so they are built once
+        self.local_corners = ((0, 0), (self.rect.width, 0), (self.rect.width, self.rect.height),
+                              (0, self.rect.height))
+
+        # Static platforms expose the same fields as moving ones, zeroed out
+        self.velocity = (0, 0)
+        self.move_type = None
 
     def update(self):
         pass
@@ -232,6 +441,13 @@ class Platform:
 
 
 class MovingPlatform(Platform):
+    __slots__ = ('original_pos', 'speed', 'distance', 'time', 'center_x', 'center_y', 'radius')
+
+    # Room around the body for the outline, which straddles the platform edge
+    SPRITE_PADDING = 2
+
+    _sprite_cache = {}
+
     def __init__(self, x, y, width, height, move_type='horizontal', speed=2, distance=100):
         super().__init__(x, y, width, height)
         self.original_pos = [x, y]
@@ -280,14 +496,24 @@ class MovingPlatform(Platform):
         self.velocity[0] = new_x - self.x
         self.velocity[1] = new_y - self.y
 
+        self.x = new_x
+        self.y = new_y
+        self.rect.x = int(new_x)
+        self.rect.y = int(new_y)
 
-        translation_matrix = MatrixMath.create_translation_matrix(new_x - self.x, new_y - self.y)
-        transformed_pos = MatrixMath.apply_transformation(translation_matrix, [self.x, self.y])
-
-        self.x = transformed_pos[0]
-        self.y = transformed_pos[1]
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+    @staticmethod
+    def get_sprite(width, height):
+        """Return a cached platform body, fill and outline together, of the given pixel size"""
+        key = (width, height)
+        sprite = MovingPlatform._sprite_cache.get(key)
+        if sprite is None:
+            pad = MovingPlatform.SPRITE_PADDING
+            sprite = pygame.Surface((width + 2 * pad + 1, height + 2 * pad + 1), pygame.SRCALPHA)
+            corners = [(pad, pad), (pad + width, pad), (pad + width, pad + height), (pad, pad + height)]
+            pygame.draw.polygon(sprite, (255, 165, 0), corners)
+            pygame.draw.polygon(sprite, (255, 140, 0), corners, 3)
+            MovingPlatform._sprite_cache[key] = sprite
+        return sprite
 
     def draw(self, screen):
 
@@ -323,6 +549,17 @@ class MovingPlatform(Platform):
 
 
 class Flag:
+    __slots__ = ('x', 'y', 'pole_height', 'flag_width', 'flag_height', 'wave_time', 'collected')
+
+    SEGMENTS = 10
+    SEGMENT_FRACTIONS = tuple(map(SEGMENTS.__rtruediv__, range(SEGMENTS + 1)))  # i / SEGMENTS
+
+    # Sprites are cached for this many phases of one wave period
+    WAVE_PHASES = 16
+    SPRITE_PADDING = 8
+
+    _sprite_cache = {}
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -336,53 +573,202 @@ class Flag:
         self.wave_time += 0.1
 
     def draw(self, screen):
-
-        pole_bottom = (int(self.x), int(self.y))
-        pole_top = (int(self.x), int(self.y - self.pole_height))
-        pygame.draw.line(screen, (139, 69, 19), pole_bottom, pole_top, 4)
+        padding = Flag.SPRITE_PADDING
+        screen.blit(self.get_sprite(), (int(self.x) - padding, int(self.y) - self.pole_height - padding))
+
+    def get_sprite(self):
+        """Return the cached pre-rendered flag for the current wave phase"""
+        phase = int(self.wave_time * Flag.WAVE_PHASES / (2 * math.pi)) % Flag.WAVE_PHASES
+        key = (self.pole_height, self.flag_width, self.flag_height, phase, self.collected)
+        sprite = Flag._sprite_cache.get(key)
+        if sprite is None:
+            padding = Flag.SPRITE_PADDING
+            sprite = pygame.Surface((self.flag_width + 2 * padding, self.pole_height + 2 * padding),
+                                    pygame.SRCALPHA)
+            self.render(sprite, padding, self.pole_height + padding, phase * 2 * math.pi / Flag.WAVE_PHASES)
+            Flag._sprite_cache[key] = sprite
+        return sprite
+
+    def render(self, surface, x, y, wave_time):
+        """Draw the flag with the foot of its pole at (x, y)"""
+
+        pole_bottom = (x, y)
+        pole_top = (x, y - self.pole_height)
+        pygame.draw.line(surface, (139, 69, 19), pole_bottom, pole_top, 4)
 
 
         flag_points = []
-        segments = 10
+        fractions = Flag.SEGMENT_FRACTIONS
+        phase = wave_time * SIN_TABLE_SCALE
+        phase_step = 0.5 * SIN_TABLE_SCALE
 
-        for i in range(segments + 1):
+        for i in range(Flag.SEGMENTS + 1):
 
-            wave_offset = math.sin(self.wave_time + i * 0.5) * 5
+            wave_offset = SIN_TABLE[int(phase + i * phase_step) & SIN_TABLE_MASK] * 5
 
 
-            point_x = self.x + (i / segments) * self.flag_width + wave_offset
-            point_y = self.y - self.pole_height
+            point_x = x + fractions[i] * self.flag_width + wave_offset
+            point_y = y - self.pole_height
             flag_points.append([point_x, point_y])
 
-        for i in range(segments, -1, -1):
+        for i in range(Flag.SEGMENTS, -1, -1):
 
-            wave_offset = math.sin(self.wave_time + i * 0.5) * 3
-            point_x = self.x + (i / segments) * self.flag_width + wave_offset
-            point_y = self.y - self.pole_height + self.flag_height
+            wave_offset = SIN_TABLE[int(phase + i * phase_step) & SIN_TABLE_MASK] * 3
+            point_x = x + fractions[i] * self.flag_width + wave_offset
+            point_y = y - self.pole_height + self.flag_height
             flag_points.append([point_x, point_y])
 
 
         if self.collected:
-            pygame.draw.polygon(screen, (0, 255, 0), flag_points)
+            pygame.draw.polygon(surface, (0, 255, 0), flag_points)
         else:
-            pygame.draw.polygon(screen, (255, 0, 0), flag_points)
+            pygame.draw.polygon(surface, (255, 0, 0), flag_points)
 
 
         if not self.collected:
 
+            start_wave = SIN_TABLE[int(phase) & SIN_TABLE_MASK] * 5
+            end_wave = SIN_TABLE[int(phase + 2 * SIN_TABLE_SCALE) & SIN_TABLE_MASK] * 5
             for i in range(3):
-                stripe_y = self.y - self.pole_height + (i + 1) * 8
-                start_wave = math.sin(self.wave_time) * 5
-                end_wave = math.sin(self.wave_time + 2) * 5
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.x + start_wave, stripe_y),
-                                 (self.x + self.flag_width + end_wave, stripe_y), 2)
-
-
-        pygame.draw.circle(screen, (255, 215, 0), pole_top, 3)
+                stripe_y = y - self.pole_height + (i + 1) * 8
+                pygame.draw.line(surface, (255, 255, 255),
+                                 (x + start_wave, stripe_y),
+                                 (x + self.flag_width + end_wave, stripe_y), 2)
+
+
+        pygame.draw.circle(surface, (255, 215, 0), pole_top, 3)
+
+
+@njit(cache=True)
+def push_out_of_rect(pos_x, pos_y, radius, vel_x, vel_y, rect_x, rect_y, rect_right, rect_bottom):
+    """Push the ball out of one rect along the axis of least overlap
+
+    Returns the new position and velocity plus the SIDE_* code of the face
+    that was hit (SIDE_NONE if the ball was moving away from it).
+    """
+    # Calculate overlap in each direction
+    overlap_left = (pos_x + radius) - rect_x
+    overlap_right = rect_right - (pos_x - radius)
+    overlap_top = (pos_y + radius) - rect_y
+    overlap_bottom = rect_bottom - (pos_y - radius)
+
+    # Find minimum overlap
+    min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+
+    # Handle collision based on minimum overlap
+    if min_overlap == overlap_top and vel_y >= 0:
+        # Landing on top of platform
+        return pos_x, rect_y - radius, vel_x, 0.0, SIDE_TOP
+    elif min_overlap == overlap_bottom and vel_y <= 0:
+        # Hitting bottom of platform
+        return pos_x, rect_bottom + radius, vel_x, 0.0, SIDE_BOTTOM
+    elif min_overlap == overlap_left and vel_x >= 0:
+        # Hitting left side of platform
+        return rect_x - radius, pos_y, 0.0, vel_y, SIDE_LEFT
+    elif min_overlap == overlap_right and vel_x <= 0:
+        # Hitting right side of platform
+        return rect_right + radius, pos_y, 0.0, vel_y, SIDE_RIGHT
+    return pos_x, pos_y, vel_x, vel_y, SIDE_NONE
+
+
+@njit(cache=True)
+def resolve_collisions(pos_x, pos_y, radius, vel_x, vel_y, platforms, static_count):
+    """Resolve ball/platform overlaps using AABB tests
+
+    platforms is an (N, 7) float array with one row per platform:
+    (x, y, width, height, velocity_x, velocity_y, kind), with the
+    static_count static platforms first. Returns the new position,
+    velocity and whether the ball landed on top of a platform.
+    """
+    on_ground = False
+    # The ball box is truncated to ints like the pygame.Rect it replaces, so
+    # sub-pixel overlaps do not collide; a zero-size box never collides
+    size = int(radius * 2)
+    if size <= 0:
+        return pos_x, pos_y, vel_x, vel_y, on_ground
+
+    # Static platforms only need the push-out, with no velocity transfer
+    for i in range(static_count):
+        rect_x = platforms[i, 0]
+        rect_y = platforms[i, 1]
+        rect_right = rect_x + platforms[i, 2]
+        rect_bottom = rect_y + platforms[i, 3]
+        left = int(pos_x - radius)
+        top = int(pos_y - radius)
+        if left < rect_right and rect_x < left + size and top < rect_bottom and rect_y < top + size:
+            pos_x, pos_y, vel_x, vel_y, side = push_out_of_rect(
+                pos_x, pos_y, radius, vel_x, vel_y, rect_x, rect_y, rect_right, rect_bottom)
+            if side == SIDE_TOP:
+                on_ground = True
+
+    for i in range(static_count, platforms.shape[0]):
+        rect_x = platforms[i, 0]
+        rect_y = platforms[i, 1]
+        rect_right = rect_x + platforms[i, 2]
+        rect_bottom = rect_y + platforms[i, 3]
+        left = int(pos_x - radius)
+        top = int(pos_y - radius)
+        if not (left < rect_right and rect_x < left + size and top < rect_bottom and rect_y < top + size):
+            continue
+
+        platform_vx = platforms[i, 4]
+        platform_vy = platforms[i, 5]
+        kind = platforms[i, 6]
+
+        pos_x, pos_y, vel_x, vel_y, side = push_out_of_rect(
+            pos_x, pos_y, radius, vel_x, vel_y, rect_x, rect_y, rect_right, rect_bottom)
+
+        # Apply platform velocity
+        if side == SIDE_TOP:
+            on_ground = True
+
+            # Add platform velocity with reduced influence
+            vel_x += platform_vx * 0.8
+            vel_y += platform_vy * 0.8
+
+            # Ensure we stay on top of vertical moving platforms
+            if kind == PLATFORM_VERTICAL:
+                vel_y = platform_vy
+        elif side == SIDE_BOTTOM:
+            vel_y += platform_vy * 0.5
+        elif side == SIDE_LEFT or side == SIDE_RIGHT:
+            vel_x += platform_vx * 0.3
+
+        # Additional check for fast-moving platforms
+        if abs(platform_vx) > 5 or abs(platform_vy) > 5:
+            # Predict next position
+            next_left = int(pos_x + vel_x - radius)
+            next_top = int(pos_y + vel_y - radius)
+
+            # If next position would also collide, adjust velocity
+            if (next_left < rect_right and rect_x < next_left + size
+                    and next_top < rect_bottom and rect_y < next_top + size):
+                if kind == PLATFORM_VERTICAL:
+                    vel_y = platform_vy
+                elif kind == PLATFORM_HORIZONTAL:
+                    vel_x = platform_vx * 0.8
+
+    return pos_x, pos_y, vel_x, vel_y, on_ground
+
+
+@njit(cache=True, fastmath=True)
+def aabb_hits(boxes, alive, left, top, right, bottom):
+    """Mask of the live (x, y, width, height) boxes that overlap the given rect"""
+    hits = np.zeros(boxes.shape[0], dtype=np.bool_)
+    # An empty rect never collides, matching pygame.Rect.colliderect
+    if right <= left or bottom <= top:
+        return hits
+    for i in range(boxes.shape[0]):
+        hits[i] = (alive[i] and boxes[i, 0] < right and left < boxes[i, 0] + boxes[i, 2]
+                   and boxes[i, 1] < bottom and top < boxes[i, 1] + boxes[i, 3])
+    return hits
 
 
 class Ball:
+    __slots__ = ('original_pos', 'pos', 'velocity', 'base_radius', 'radius', 'color', 'on_ground',
+                 'scale_factor', 'scale_timer', 'rotation', 'lives', 'gravity', 'jump_force',
+                 'move_speed', 'friction')
+
     def __init__(self, x, y):
         self.original_pos = [x, y]
         self.pos = [x, y]
@@ -422,9 +808,7 @@ class Ball:
                 self.scale_factor = 1.0
 
 
-        scale_matrix = MatrixMath.create_scale_matrix(self.scale_factor, self.scale_factor)
-        scaled_radius_point = MatrixMath.apply_transformation(scale_matrix, [self.base_radius, 0])
-        self.radius = abs(scaled_radius_point[0])
+        self.radius = abs(self.scale_factor) * self.base_radius
 
 
         if not self.on_ground:
@@ -438,8 +822,7 @@ class Ball:
             self.rotation += self.velocity[0] * 0.1
 
 
-        translation_matrix = MatrixMath.create_translation_matrix(self.velocity[0], self.velocity[1])
-        self.pos = MatrixMath.apply_transformation(translation_matrix, self.pos)
+        self.pos = [self.pos[0] + self.velocity[0], self.pos[1] + self.velocity[1]]
 
 
         self.on_ground = False
@@ -454,91 +837,18 @@ class Ball:
         if self.on_ground:
             self.velocity[1] = self.jump_force
 
-    def handle_platform_collision(self, platforms):
-        ball_rect = pygame.Rect(self.pos[0] - self.radius, self.pos[1] - self.radius,
-                                self.radius * 2, self.radius * 2)
-
-        # Store previous position for collision resolution
-        prev_pos = self.pos.copy()
-
-        for platform in platforms:
-            if ball_rect.colliderect(platform.rect):
-                # Calculate platform velocity for moving platforms
-                platform_velocity = [0, 0]
-                if isinstance(platform, MovingPlatform):
-                    platform_velocity = platform.velocity
-
-                # Calculate overlap in each direction
-                overlap_left = (self.pos[0] + self.radius) - platform.rect.left
-                overlap_right = platform.rect.right - (self.pos[0] - self.radius)
-                overlap_top = (self.pos[1] + self.radius) - platform.rect.top
-                overlap_bottom = platform.rect.bottom - (self.pos[1] - self.radius)
-
-                # Find minimum overlap
-                min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
-
-                # Handle collision based on minimum overlap
-                if min_overlap == overlap_top and self.velocity[1] >= 0:
-                    # Landing on top of platform
-                    self.pos[1] = platform.rect.top - self.radius
-                    self.velocity[1] = 0
-                    self.on_ground = True
-
-                    # Apply platform velocity
-                    if isinstance(platform, MovingPlatform):
-                        # Add platform velocity with reduced influence
-                        self.velocity[0] += platform_velocity[0] * 0.8
-                        self.velocity[1] += platform_velocity[1] * 0.8
-
-                        # Ensure we stay on top of vertical moving platforms
-                        if platform.move_type == 'vertical':
-                            self.pos[1] = platform.rect.top - self.radius
-                            self.velocity[1] = platform_velocity[1]
-
-                elif min_overlap == overlap_bottom and self.velocity[1] <= 0:
-                    # Hitting bottom of platform
-                    self.pos[1] = platform.rect.bottom + self.radius
-                    self.velocity[1] = 0
-
-                    # Apply platform velocity
-                    if isinstance(platform, MovingPlatform):
-                        self.velocity[1] += platform_velocity[1] * 0.5
-
-                elif min_overlap == overlap_left and self.velocity[0] >= 0:
-                    # Hitting left side of platform
-                    self.pos[0] = platform.rect.left - self.radius
-                    self.velocity[0] = 0
-
-                    # Apply platform velocity
-                    if isinstance(platform, MovingPlatform):
-                        self.velocity[0] += platform_velocity[0] * 0.3
-
-                elif min_overlap == overlap_right and self.velocity[0] <= 0:
-                    # Hitting right side of platform
-                    self.pos[0] = platform.rect.right + self.radius
-                    self.velocity[0] = 0
-
-                    # Apply platform velocity
-                    if isinstance(platform, MovingPlatform):
-                        self.velocity[0] += platform_velocity[0] * 0.3
-
-                # Update ball rect after position change
-                ball_rect.x = self.pos[0] - self.radius
-                ball_rect.y = self.pos[1] - self.radius
-
-                # Additional check for fast-moving platforms
-                if isinstance(platform, MovingPlatform) and (abs(platform_velocity[0]) > 5 or abs(platform_velocity[1]) > 5):
-                    # Predict next position
-                    next_pos = [self.pos[0] + self.velocity[0], self.pos[1] + self.velocity[1]]
-                    next_rect = pygame.Rect(next_pos[0] - self.radius, next_pos[1] - self.radius,
-                                          self.radius * 2, self.radius * 2)
-                    
-                    # If next position would also collide, adjust velocity
-                    if next_rect.colliderect(platform.rect):
-                        if platform.move_type == 'vertical':
-                            self.velocity[1] = platform_velocity[1]
-                        elif platform.move_type == 'horizontal':
-                            self.velocity[0] = platform_velocity[0] * 0.8
+    def handle_platform_collision(self, platform_array, static_count):
+        """Resolve collisions against the packed platform array (see resolve_collisions)"""
+        pos_x, pos_y, vel_x, vel_y, landed = resolve_collisions(
+            float(self.pos[0]), float(self.pos[1]), float(self.radius),
+            float(self.velocity[0]), float(self.velocity[1]), platform_array, static_count)
+
+        self.pos[0] = pos_x
+        self.pos[1] = pos_y
+        self.velocity[0] = vel_x
+        self.velocity[1] = vel_y
+        if landed:
+            self.on_ground = True
 
     def draw(self, screen):
 
@@ -548,11 +858,11 @@ class Ball:
         pygame.draw.circle(screen, self.color, center, int(self.radius))
 
 
-        rotation_matrix = MatrixMath.create_rotation_matrix(self.rotation)
-        edge_point = [self.radius * 0.7, 0]
-        rotated_edge = MatrixMath.apply_transformation(rotation_matrix, edge_point)
+        edge_length = self.radius * 0.7
+        edge_x = edge_length * math.cos(self.rotation)
+        edge_y = edge_length * math.sin(self.rotation)
 
-        end_pos = (int(self.pos[0] + rotated_edge[0]), int(self.pos[1] + rotated_edge[1]))
+        end_pos = (int(self.pos[0] + edge_x), int(self.pos[1] + edge_y))
         pygame.draw.line(screen, (150, 0, 0), center, end_pos, 3)
 
 
@@ -576,6 +886,30 @@ class Game:
         pygame.draw.rect(self.flag_image, (255, 255, 255), (0, 0, 60, 13))
         pygame.draw.rect(self.flag_image, (255, 255, 255), (0, 13, 60, 13))
         pygame.draw.rect(self.flag_image, (255, 255, 255), (0, 26, 60, 13))
+        flag_width, flag_height = self.flag_image.get_size()
+        self.flag_mips = [self.flag_image] + [
+            pygame.transform.smoothscale(self.flag_image, (flag_width >> level, flag_height >> level))
+            for level in range(1, FLAG_MIP_LEVELS)]
+        self.flag_scaled_cache = collections.OrderedDict()
+
+        self.font = pygame.font.Font(None, 36)
+        self.hint_font = pygame.font.Font(None, 24)
+        self.small_hint_font = pygame.font.Font(None, 20)
+
+        # Key codes polled every frame, bound once
+        self.left_keys = (pygame.K_LEFT, pygame.K_a)
+        self.right_keys = (pygame.K_RIGHT, pygame.K_d)
+        self.jump_keys = (pygame.K_SPACE, pygame.K_UP)
+
+        # Screen-sized copy of the static scene; only rebuilt when the view matrix changes
+        self.background = pygame.Surface((self.width, self.height)).convert()
+        self.background_view = None
+
+        # Arrow triangles are written into these vertex lists in place every frame
+        self.arrow_triangles = []
+
+        # Reused every frame by check_collisions instead of allocating a new Rect
+        self.ball_rect = pygame.Rect(0, 0, 0, 0)
 
         self.current_level = 1
         self.max_level = 3
@@ -586,14 +920,34 @@ class Game:
         self.ball = Ball(100, 400)
         self.platforms = self.create_platforms()
         self.moving_platforms = self.create_moving_platforms()
+        # Static platforms first: only collision needs the combined list, updates touch moving ones
         self.all_platforms = self.platforms + self.moving_platforms
+        self.platform_array = self.create_platform_array()
+        self.moving_corners_local = self.create_moving_corners_local()
+        self.static_corners = self.create_static_corners()
         self.coins = self.create_coins()
         self.powerups = self.create_powerups()
+        self.coins_collected = 0
+        self.coins_total = len(self.coins)
+
+        # Column arrays so pickups can be hit-tested in one vectorized pass
+        self.coin_xy = np.array([(coin.x, coin.y) for coin in self.coins], dtype=np.float64).reshape(-1, 2)
+        self.coin_radii = np.array([coin.radius for coin in self.coins], dtype=np.float64)
+        self.coin_alive = np.ones(len(self.coins), dtype=bool)
+        self.coin_boxes = np.hstack([self.coin_xy - self.coin_radii[:, None],
+                                     np.repeat(2 * self.coin_radii[:, None], 2, axis=1)])
+        self.powerup_xy = np.array([(powerup.x, powerup.y) for powerup in self.powerups],
+                                   dtype=np.float64).reshape(-1, 2)
+        self.powerup_size = np.array([(powerup.width, powerup.height) for powerup in self.powerups],
+                                     dtype=np.float64).reshape(-1, 2)
+        self.powerup_alive = np.ones(len(self.powerups), dtype=bool)
+        self.powerup_boxes = np.hstack([self.powerup_xy, self.powerup_size])
         self.flag = Flag(1850, 450)
+        self.flag_rect = pygame.Rect(self.flag.x - 10, self.flag.y - self.flag.pole_height,
+                                     self.flag.flag_width + 20, self.flag.pole_height + 20)
         self.camera = Camera(self.width, self.height)
         self.score = 0
         self.level_complete = False
-        self.font = pygame.font.Font(None, 36)
         self.frame_alpha = 0.0
 
     def create_platforms(self):
@@ -670,6 +1024,74 @@ class Game:
             ]
         return moving_platforms
 
+    def create_platform_array(self):
+        """Pack every platform into a contiguous array for resolve_collisions"""
+        platform_array = np.empty((len(self.all_platforms), 7), dtype=np.float64)
+        for i, platform in enumerate(self.all_platforms):
+            platform_array[i, 0] = platform.rect.x
+            platform_array[i, 1] = platform.rect.y
+            platform_array[i, 2] = platform.rect.width
+            platform_array[i, 3] = platform.rect.height
+            platform_array[i, 4] = platform.velocity[0]
+            platform_array[i, 5] = platform.velocity[1]
+            platform_array[i, 6] = MOVE_TYPE_CODES[platform.move_type]
+        return platform_array
+
+    def create_moving_corners_local(self):
+        """Build an (M, 4, 2) array of moving-platform corners relative to each rect's top-left"""
+        return np.array([platform.local_corners for platform in self.moving_platforms],
+                        dtype=np.float32).reshape(-1, 4, 2)
+
+    def get_moving_corners(self, indices=slice(None)):
+        """World-space corners of the selected moving platforms, shape (M, 4, 2)"""
+        # The x/y columns of the moving rows in platform_array are the rect origins
+        origins = self.platform_array[len(self.platforms):, :2][indices]
+        return self.moving_corners_local[indices] + origins[:, None, :].astype(np.float32)
+
+    def update_platform_array(self):
+        """Refresh the moving-platform rows of the collision array in place"""
+        offset = len(self.platforms)
+        for i, platform in enumerate(self.moving_platforms, offset):
+            self.platform_array[i, 0] = platform.rect.x
+            self.platform_array[i, 1] = platform.rect.y
+            self.platform_array[i, 4] = platform.velocity[0]
+            self.platform_array[i, 5] = platform.velocity[1]
+
+    def create_static_corners(self):
+        """Build an (S, 4, 2) array of static-platform corners in world space"""
+        return np.array([[(platform.rect.x + x, platform.rect.y + y) for x, y in platform.local_corners]
+                         for platform in self.platforms], dtype=np.float32).reshape(-1, 4, 2)
+
+    def get_scaled_flag(self, size):
+        """Return the flag image scaled to size, reusing recent results"""
+        cache = self.flag_scaled_cache
+        scaled = cache.get(size)
+        if scaled is None:
+            # Scale from the smallest mip that is still at least as large as the target
+            source = self.flag_mips[0]
+            for mip in self.flag_mips[1:]:
+                if mip.get_width() < size[0] or mip.get_height() < size[1]:
+                    break
+                source = mip
+            scaled = cache[size] = pygame.transform.scale(source, size)
+            if len(cache) > FLAG_SCALE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(size)
+        return scaled
+
+    def draw_static_platforms(self, surface):
+        """Draw the static platforms the camera can see onto surface"""
+        # A handful of direct polygon draws beats blitting or rescaling a pre-rendered level
+        cam_min_x, cam_min_y, cam_max_x, cam_max_y = self.camera.get_visible_world_bounds(CULL_MARGIN)
+        static = self.platform_array[:len(self.platforms)]
+        visible = np.flatnonzero((static[:, 0] + static[:, 2] > cam_min_x) & (static[:, 0] < cam_max_x)
+                                 & (static[:, 1] + static[:, 3] > cam_min_y) & (static[:, 1] < cam_max_y))
+        draw_polygon = pygame.draw.polygon
+        for corners in self.camera.world_to_screen_batch(self.static_corners[visible]).tolist():
+            draw_polygon(surface, (0, 255, 0), corners)
+            draw_polygon(surface, (0, 200, 0), corners, 2)
+
     def create_coins(self):
         """Create coins based on current level"""
         if self.current_level == 1:
@@ -762,31 +1184,37 @@ class Game:
         self.camera.update()
 
     def check_collisions(self):
-        ball_rect = pygame.Rect(self.ball.pos[0] - self.ball.radius,
-                                self.ball.pos[1] - self.ball.radius,
-                                self.ball.radius * 2, self.ball.radius * 2)
-
-        for coin in self.coins:
-            if not coin.collected:
-                coin_rect = pygame.Rect(coin.x - coin.radius, coin.y - coin.radius,
-                                        coin.radius * 2, coin.radius * 2)
-                if ball_rect.colliderect(coin_rect):
-                    coin.collected = True
-                    self.score += 10
-                    self.camera.add_screen_shake(1, 5)
-
-        for powerup in self.powerups:
-            if not powerup.collected:
-                powerup_rect = pygame.Rect(powerup.x, powerup.y, powerup.width, powerup.height)
-                if ball_rect.colliderect(powerup_rect):
-                    powerup.collected = True
-                    self.ball.apply_powerup(powerup.power_type)
-                    self.camera.add_screen_shake(2, 8)
+        ball_x, ball_y = self.ball.pos
+        ball_radius = self.ball.radius
+
+        # Truncated to ints like the pygame.Rect the pickups used to be tested against
+        ball_left, ball_top = int(ball_x - ball_radius), int(ball_y - ball_radius)
+        ball_size = int(ball_radius * 2)
+        ball_right, ball_bottom = ball_left + ball_size, ball_top + ball_size
+
+        coin_hits = aabb_hits(self.coin_boxes, self.coin_alive, ball_left, ball_top, ball_right, ball_bottom)
+        for i in np.flatnonzero(coin_hits):
+            self.coin_alive[i] = False
+            self.coins[i].collected = True
+            self.coins_collected += 1
+            self.score += 10
+            self.camera.add_screen_shake(1, 5)
+
+        powerup_hits = aabb_hits(self.powerup_boxes, self.powerup_alive,
+                                 ball_left, ball_top, ball_right, ball_bottom)
+        for i in np.flatnonzero(powerup_hits):
+            powerup = self.powerups[i]
+            self.powerup_alive[i] = False
+            powerup.collected = True
+            self.ball.apply_powerup(powerup.power_type)
+            self.camera.add_screen_shake(2, 8)
 
         if not self.flag.collected:
-            flag_rect = pygame.Rect(self.flag.x - 10, self.flag.y - self.flag.pole_height,
-                                    self.flag.flag_width + 20, self.flag.pole_height + 20)
-            if ball_rect.colliderect(flag_rect):
+            ball_rect = self.ball_rect
+            ball_rect.x = ball_x - ball_radius
+            ball_rect.y = ball_y - ball_radius
+            ball_rect.width = ball_rect.height = ball_radius * 2
+            if ball_rect.colliderect(self.flag_rect):
                 self.flag.collected = True
                 self.level_complete = True
                 self.score += 100
@@ -806,50 +1234,61 @@ class Game:
         return screen_pos
 
     def draw_ui(self):
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-
-        level_text = self.font.render(f"Level: {self.current_level}/{self.max_level}", True, (255, 255, 255))
-        self.screen.blit(level_text, (10, 50))
-
-        # Draw lives
-        lives_text = self.font.render(f"Lives: {self.ball.lives}", True, (255, 255, 255))
-        self.screen.blit(lives_text, (10, 90))
-
-        coins_collected = sum(1 for coin in self.coins if coin.collected)
-        coin_text = self.font.render(f"Coins: {coins_collected}/{len(self.coins)}", True, (255, 255, 255))
-        self.screen.blit(coin_text, (10, 130))
+        white = (255, 255, 255)
+        hud = [
+            (render_text(self.font, f"Score: {self.score}", white), (10, 10)),
+            (render_text(self.font, f"Level: {self.current_level}/{self.max_level}", white), (10, 50)),
+            (render_text(self.font, f"Lives: {self.ball.lives}", white), (10, 90)),
+            (render_text(self.font, f"Coins: {self.coins_collected}/{self.coins_total}", white), (10, 130)),
+        ]
 
         if self.ball.scale_timer > 0:
             power_type = "LARGE" if self.ball.scale_factor > 1 else "SMALL"
-            power_text = self.font.render(f"Power: {power_type} ({self.ball.scale_timer // 60 + 1}s)",
-                                          True, (255, 255, 0))
-            self.screen.blit(power_text, (10, 170))
+            power_text = render_text(self.font, f"Power: {power_type} ({self.ball.scale_timer // 60 + 1}s)",
+                                     (255, 255, 0))
+            hud.append((power_text, (10, 170)))
 
-        cam_info = self.font.render(f"Zoom: {self.camera.zoom:.2f}x", True, (150, 150, 255))
-        self.screen.blit(cam_info, (10, 210))
+        cam_info = render_text(self.font, f"Zoom: {self.camera.zoom:.2f}x", (150, 150, 255))
+        hud.append((cam_info, (10, 210)))
 
         if not self.level_complete:
-            inst_text = pygame.font.Font(None, 24).render(
-                "ARROWS/AD: move, SPACE: jump. Reach the flag to win!",
-                True, (200, 200, 200))
-            self.screen.blit(inst_text, (10, self.height - 50))
+            inst_text = render_text(
+                self.hint_font, "ARROWS/AD: move, SPACE: jump. Reach the flag to win!",
+                (200, 200, 200))
+            hud.append((inst_text, (10, self.height - 50)))
 
-            zoom_text = pygame.font.Font(None, 20).render(
-                "Orange platforms move! Camera uses matrix interpolation!",
-                True, (180, 180, 180))
-            self.screen.blit(zoom_text, (10, self.height - 25))
+            zoom_text = render_text(
+                self.small_hint_font, "Orange platforms move! Camera uses matrix interpolation!",
+                (180, 180, 180))
+            hud.append((zoom_text, (10, self.height - 25)))
 
         if self.level_complete and self.current_level == self.max_level:
-            complete_text = self.font.render("GAME COMPLETE! Press R to restart", True, (0, 255, 0))
+            complete_text = render_text(self.font, "GAME COMPLETE! Press R to restart", (0, 255, 0))
             text_rect = complete_text.get_rect(center=(self.width // 2, self.height // 2))
-            self.screen.blit(complete_text, text_rect)
+            hud.append((complete_text, text_rect))
+
+        # One C call for every HUD line; the returned rects are this frame's HUD dirty rects
+        return self.screen.blits(hud)
 
     def run(self):
         running = True
+        handled_events = [pygame.QUIT, pygame.KEYDOWN]
+        left_key, alt_left_key = self.left_keys
+        right_key, alt_right_key = self.right_keys
+        jump_key, alt_jump_key = self.jump_keys
+        fall_limit = self.height + 100
+        draw_circle = pygame.draw.circle
+        draw_polygon = pygame.draw.polygon
+        draw_line = pygame.draw.line
+        background = self.background
+        previous_view = None
+        previous_dirty = []
 
         while running:
-            for event in pygame.event.get():
+            # Only dequeue the events the game reacts to, then drop the rest (mouse motion etc.)
+            events = pygame.event.get(handled_events)
+            pygame.event.clear(pump=False)
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -863,19 +1302,20 @@ class Game:
                         self.camera.add_screen_shake(10, 60)  # Strong shake for life loss
 
             keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            if keys[left_key] or keys[alt_left_key]:
                 self.ball.move_left()
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            if keys[right_key] or keys[alt_right_key]:
                 self.ball.move_right()
-            if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
+            if keys[jump_key] or keys[alt_jump_key]:
                 self.ball.jump()
 
             if not self.level_complete:
                 self.ball.update()
-                self.ball.handle_platform_collision(self.all_platforms)
+                self.ball.handle_platform_collision(self.platform_array, len(self.platforms))
 
                 for platform in self.moving_platforms:
                     platform.update()
+                self.update_platform_array()
 
                 for coin in self.coins:
                     coin.update()
@@ -884,7 +1324,7 @@ class Game:
                 self.check_collisions()
                 self.update_camera()
 
-                if self.ball.pos[1] > self.height + 100:
+                if self.ball.pos[1] > fall_limit:
                     self.ball.pos = list(self.ball.original_pos)
                     self.ball.velocity = [0, 0]
                     self.ball.lives -= 1  # Lose a life when falling off
@@ -893,166 +1333,163 @@ class Game:
                         self.reset_level()
                         self.camera.add_screen_shake(10, 60)  # Strong shake for life loss
 
-            self.screen.fill((50, 50, 100))
-
-            # Draw platforms
-            for platform in self.platforms:
-                corners = [
-                    [platform.rect.x, platform.rect.y],
-                    [platform.rect.x + platform.rect.width, platform.rect.y],
-                    [platform.rect.x + platform.rect.width, platform.rect.y + platform.rect.height],
-                    [platform.rect.x, platform.rect.y + platform.rect.height]
-                ]
-
-                screen_corners = []
-                for corner in corners:
-                    screen_pos = self.camera.world_to_screen(corner)
-                    screen_corners.append(screen_pos)
-
-                if any(-100 < pos[0] < self.width + 100 and -100 < pos[1] < self.height + 100
-                       for pos in screen_corners):
-                    pygame.draw.polygon(self.screen, (0, 255, 0), screen_corners)
-                    pygame.draw.polygon(self.screen, (0, 200, 0), screen_corners, 2)
-
-            # Draw moving platforms
-            for platform in self.moving_platforms:
-                corners = [
-                    [platform.rect.x, platform.rect.y],
-                    [platform.rect.x + platform.rect.width, platform.rect.y],
-                    [platform.rect.x + platform.rect.width, platform.rect.y + platform.rect.height],
-                    [platform.rect.x, platform.rect.y + platform.rect.height]
-                ]
-
-                screen_corners = []
-                for corner in corners:
-                    screen_pos = self.camera.world_to_screen(corner)
-                    screen_corners.append(screen_pos)
-
-                if any(-100 < pos[0] < self.width + 100 and -100 < pos[1] < self.height + 100
-                       for pos in screen_corners):
-                    pygame.draw.polygon(self.screen, (255, 165, 0), screen_corners)
-                    pygame.draw.polygon(self.screen, (255, 140, 0), screen_corners, 3)
-
-                    center_world = [platform.rect.centerx, platform.rect.centery]
-                    center_screen = self.camera.world_to_screen(center_world)
-                    center_x, center_y = int(center_screen[0]), int(center_screen[1])
-
-                    if platform.move_type == 'horizontal':
-                        arrow_size = 8 * self.camera.zoom
-                        pygame.draw.polygon(self.screen, (255, 255, 255), [
-                            (center_x - arrow_size, center_y - arrow_size // 2),
-                            (center_x - arrow_size * 1.5, center_y),
-                            (center_x - arrow_size, center_y + arrow_size // 2)
-                        ])
-                        pygame.draw.polygon(self.screen, (255, 255, 255), [
-                            (center_x + arrow_size, center_y - arrow_size // 2),
-                            (center_x + arrow_size * 1.5, center_y),
-                            (center_x + arrow_size, center_y + arrow_size // 2)
-                        ])
-                    elif platform.move_type == 'vertical':
-                        arrow_size = 8 * self.camera.zoom
-                        pygame.draw.polygon(self.screen, (255, 255, 255), [
-                            (center_x - arrow_size // 2, center_y - arrow_size),
-                            (center_x, center_y - arrow_size * 1.5),
-                            (center_x + arrow_size // 2, center_y - arrow_size)
-                        ])
-                        pygame.draw.polygon(self.screen, (255, 255, 255), [
-                            (center_x - arrow_size // 2, center_y + arrow_size),
-                            (center_x, center_y + arrow_size * 1.5),
-                            (center_x + arrow_size // 2, center_y + arrow_size)
-                        ])
-                    elif platform.move_type == 'circular':
-                        radius = 8 * self.camera.zoom
-                        pygame.draw.circle(self.screen, (255, 255, 255), (center_x, center_y), int(radius), 2)
-                        pygame.draw.polygon(self.screen, (255, 255, 255), [
-                            (center_x + radius * 0.7, center_y - radius * 0.7),
-                            (center_x + radius * 1.2, center_y - radius * 0.3),
-                            (center_x + radius * 0.9, center_y - radius * 0.9)
-                        ])
+            # Bind per frame: reset_level can replace the camera, ball and flag
+            camera = self.camera
+            zoom = camera.zoom
+            screen = self.screen
+            ball = self.ball
+            flag = self.flag
+
+            view = camera.view_matrix
+            if view is self.background_view:
+                # Still camera: only restore the background under what was drawn last frame
+                for rect in previous_dirty:
+                    screen.blit(background, rect, rect)
+                full_redraw = False
+            elif view is previous_view:
+                # The camera just came to rest: cache the static scene for the dirty-rect path
+                self.background_view = view
+                background.fill(BACKGROUND_COLOR)
+                self.draw_static_platforms(background)
+                screen.blit(background, (0, 0))
+                full_redraw = True
+            else:
+                # Moving camera: draw the static scene straight to the screen
+                screen.fill(BACKGROUND_COLOR)
+                self.draw_static_platforms(screen)
+                full_redraw = True
+            previous_view = view
+            dirty = []
+
+            # Cull in world space against the inverse-transformed screen before any transform work
+            cam_min_x, cam_min_y, cam_max_x, cam_max_y = camera.get_visible_world_bounds(CULL_MARGIN)
+            min_world_size = MIN_PIXEL_SIZE / zoom
+
+            moving = self.platform_array[len(self.platforms):]
+            moving_visible = np.flatnonzero((moving[:, 0] + moving[:, 2] > cam_min_x) & (moving[:, 0] < cam_max_x)
+                                            & (moving[:, 1] + moving[:, 3] > cam_min_y)
+                                            & (moving[:, 1] < cam_max_y))
+            coin_x = self.coin_xy[:, 0]
+            coin_y = self.coin_xy[:, 1]
+            coin_radii = self.coin_radii
+            coin_visible = np.flatnonzero(self.coin_alive & (coin_radii >= min_world_size)
+                                          & (coin_x + coin_radii > cam_min_x) & (coin_x - coin_radii < cam_max_x)
+                                          & (coin_y + coin_radii > cam_min_y) & (coin_y - coin_radii < cam_max_y))
+            powerup_x = self.powerup_xy[:, 0]
+            powerup_y = self.powerup_xy[:, 1]
+            powerup_w = self.powerup_size[:, 0]
+            powerup_h = self.powerup_size[:, 1]
+            powerup_visible = np.flatnonzero(self.powerup_alive & (np.minimum(powerup_w, powerup_h) >= min_world_size)
+                                             & (powerup_x + powerup_w > cam_min_x) & (powerup_x < cam_max_x)
+                                             & (powerup_y + powerup_h > cam_min_y) & (powerup_y < cam_max_y))
+
+            flag_visible = (not flag.collected and cam_min_x < flag.x < cam_max_x
+                            and cam_min_y < flag.y < cam_max_y)
+            ball_x, ball_y = ball.pos
+            ball_radius = ball.radius
+            ball_visible = (ball_radius >= min_world_size
+                            and ball_x + ball_radius > cam_min_x and ball_x - ball_radius < cam_max_x
+                            and ball_y + ball_radius > cam_min_y and ball_y - ball_radius < cam_max_y)
+
+            single_points = []
+            if flag_visible:
+                single_points.append((flag.x, flag.y))
+            if ball_visible:
+                # Rotating (r, 0) only needs the first column of the rotation matrix
+                edge_radius = ball_radius * 0.7
+                single_points.append((ball_x, ball_y))
+                single_points.append((ball_x + math.cos(ball.rotation) * edge_radius,
+                                      ball_y + math.sin(ball.rotation) * edge_radius))
+
+            # Transform every point drawn this frame in one batch, then slice it back per entity
+            point_groups = [
+                self.get_moving_corners(moving_visible).reshape(-1, 2),
+                moving[moving_visible, :2] + moving[moving_visible, 2:4] // 2,
+                self.coin_xy[coin_visible],
+                self.powerup_xy[powerup_visible],
+                np.array(single_points, dtype=np.float32).reshape(-1, 2),
+            ]
+            screen_points = camera.world_to_screen_batch(np.vstack(point_groups))
+            splits = np.cumsum([len(group) for group in point_groups[:-1]])
+            (corner_screen, center_screen, coin_screen,
+             powerup_screen, single_screen) = np.split(screen_points, splits)
+            single_screen = single_screen.tolist()
+
+            # Draw moving platforms, collecting their arrows to draw over the platform sprites
+            corner_screen = corner_screen.reshape(-1, 4, 2)
+            platform_origins = (corner_screen[:, 0] - MovingPlatform.SPRITE_PADDING).tolist()
+            platform_sizes = np.rint(corner_screen[:, 2] - corner_screen[:, 0]).astype(int).tolist()
+            arrow_triangles = self.arrow_triangles
+            arrow_count = 0
+            arrow_rings = []
+            zoom_bin = round(zoom * ARROW_ZOOM_BINS) / ARROW_ZOOM_BINS
+            for i, center_screen_pos in zip(moving_visible.tolist(), center_screen.tolist()):
+                center_x, center_y = int(center_screen_pos[0]), int(center_screen_pos[1])
+                triangles, ring_radius = arrow_template(zoom_bin, self.moving_platforms[i].move_type)
+                if ring_radius:
+                    arrow_rings.append(((center_x, center_y), ring_radius))
+                for x0, y0, x1, y1, x2, y2 in triangles:
+                    arrow_count = write_triangle(arrow_triangles, arrow_count,
+                                                 center_x + x0, center_y + y0,
+                                                 center_x + x1, center_y + y1,
+                                                 center_x + x2, center_y + y2)
+
+            # Fill and outline come from one cached sprite per size, all blitted in a single call
+            dirty += screen.blits([(MovingPlatform.get_sprite(width, height), (int(x), int(y)))
+                                   for (x, y), (width, height) in zip(platform_origins, platform_sizes)])
+            for center, radius in arrow_rings:
+                dirty.append(draw_circle(screen, (255, 255, 255), center, radius, 2))
+            for k in range(arrow_count):
+                dirty.append(draw_polygon(screen, (255, 255, 255), arrow_triangles[k]))
 
             # Draw coins
-            for coin in self.coins:
-                if not coin.collected:
-                    screen_pos = self.camera.world_to_screen([coin.x, coin.y])
-                    if -50 < screen_pos[0] < self.width + 50 and -50 < screen_pos[1] < self.height + 50:
-                        vertices = []
-                        for i in range(8):
-                            vertex_angle = (i * math.pi * 2 / 8) + coin.rotation
-                            world_x = coin.x + math.cos(vertex_angle) * coin.radius
-                            world_y = coin.y + math.sin(vertex_angle) * coin.radius
-                            vertex_screen = self.camera.world_to_screen([world_x, world_y])
-                            vertices.append(vertex_screen)
-
-                        pygame.draw.polygon(self.screen, (255, 255, 0), vertices)
-                        inner_radius = coin.radius * self.camera.zoom * 0.7
-                        pygame.draw.circle(self.screen, (255, 215, 0),
-                                           (int(screen_pos[0]), int(screen_pos[1])), int(max(1, inner_radius)))
+            for i, screen_pos in zip(coin_visible.tolist(), coin_screen.tolist()):
+                coin = self.coins[i]
+                sprite = coin.get_sprite(coin.radius * zoom)
+                dirty.append(screen.blit(sprite, sprite.get_rect(center=(int(screen_pos[0]), int(screen_pos[1])))))
 
             # Draw powerups
-            for powerup in self.powerups:
-                if not powerup.collected:
-                    screen_pos = self.camera.world_to_screen([powerup.x, powerup.y])
-                    if -50 < screen_pos[0] < self.width + 50 and -50 < screen_pos[1] < self.height + 50:
-                        scaled_width = powerup.width * self.camera.zoom
-                        scaled_height = powerup.height * self.camera.zoom
-
-                        powerup_rect = pygame.Rect(screen_pos[0], screen_pos[1],
-                                                   scaled_width, scaled_height)
-                        pygame.draw.rect(self.screen, powerup.color, powerup_rect)
-
-                        if powerup.power_type == 'grow':
-                            line_len = scaled_width * 0.3
-                            center_x, center_y = screen_pos[0] + scaled_width / 2, screen_pos[1] + scaled_height / 2
-                            pygame.draw.line(self.screen, (255, 255, 255),
-                                             (center_x, center_y - line_len), (center_x, center_y + line_len), 2)
-                            pygame.draw.line(self.screen, (255, 255, 255),
-                                             (center_x - line_len, center_y), (center_x + line_len, center_y), 2)
-                        else:
-                            line_len = scaled_width * 0.3
-                            center_x, center_y = screen_pos[0] + scaled_width / 2, screen_pos[1] + scaled_height / 2
-                            pygame.draw.line(self.screen, (255, 255, 255),
-                                             (center_x - line_len, center_y), (center_x + line_len, center_y), 2)
+            for i, screen_pos in zip(powerup_visible.tolist(), powerup_screen.tolist()):
+                powerup = self.powerups[i]
+                sprite = powerup.get_sprite(int(powerup.width * zoom),
+                                            int(powerup.height * zoom))
+                dirty.append(screen.blit(sprite, (int(screen_pos[0]), int(screen_pos[1]))))
 
             # Draw flag
-            if not self.flag.collected:
-                screen_pos = self.camera.world_to_screen([self.flag.x, self.flag.y])
-                if -100 < screen_pos[0] < self.width + 100 and -100 < screen_pos[1] < self.height + 100:
-                    # Draw pole
-                    pole_bottom = (int(screen_pos[0]), int(screen_pos[1]))
-                    pole_top = (int(screen_pos[0]), int(screen_pos[1] - self.flag.pole_height * self.camera.zoom))
-                    pygame.draw.line(self.screen, (139, 69, 19), pole_bottom, pole_top, int(4 * self.camera.zoom))
-
-                    # Draw flag image
-                    scaled_flag = pygame.transform.scale(self.flag_image, 
-                        (int(self.flag.flag_width * self.camera.zoom), 
-                         int(self.flag.flag_height * self.camera.zoom)))
-                    self.screen.blit(scaled_flag, 
-                        (int(screen_pos[0]), int(screen_pos[1] - self.flag.pole_height * self.camera.zoom)))
+            if flag_visible:
+                flag_x, flag_y = single_screen[0]
+                # Draw pole
+                flag_top = flag_y - flag.pole_height * zoom
+                pole_bottom = (int(flag_x), int(flag_y))
+                pole_top = (int(flag_x), int(flag_top))
+                dirty.append(draw_line(screen, (139, 69, 19), pole_bottom, pole_top, int(4 * zoom)))
+
+                # Draw flag image
+                scaled_flag = self.get_scaled_flag((int(flag.flag_width * zoom),
+                                                    int(flag.flag_height * zoom)))
+                dirty.append(screen.blit(scaled_flag, (int(flag_x), int(flag_top))))
 
             # Draw ball
-            ball_screen_pos = self.camera.world_to_screen(self.ball.pos)
-            scaled_radius = self.ball.radius * self.camera.zoom
-
-            if scaled_radius > 1:
+            if ball_visible:
+                ball_screen_pos, screen_edge_pos = single_screen[-2:]
+                scaled_radius = ball_radius * zoom
                 center = (int(ball_screen_pos[0]), int(ball_screen_pos[1]))
-                pygame.draw.circle(self.screen, self.ball.color, center, int(scaled_radius))
+                dirty.append(draw_circle(screen, ball.color, center, int(scaled_radius)))
 
-                rotation_matrix = MatrixMath.create_rotation_matrix(self.ball.rotation)
-                edge_point = [self.ball.radius * 0.7, 0]
-                rotated_edge = MatrixMath.apply_transformation(rotation_matrix, edge_point)
+                dirty.append(draw_line(screen, (150, 0, 0), center,
+                                       (int(screen_edge_pos[0]), int(screen_edge_pos[1])), 3))
 
-                world_edge_pos = [self.ball.pos[0] + rotated_edge[0], self.ball.pos[1] + rotated_edge[1]]
-                screen_edge_pos = self.camera.world_to_screen(world_edge_pos)
+                if ball.scale_timer > 0:
+                    color = (255, 0, 255) if ball.scale_factor > 1 else (0, 255, 255)
+                    dirty.append(draw_circle(screen, color, center, int(scaled_radius + 5 * zoom), 2))
 
-                pygame.draw.line(self.screen, (150, 0, 0), center,
-                                 (int(screen_edge_pos[0]), int(screen_edge_pos[1])), 3)
-
-                if self.ball.scale_timer > 0:
-                    color = (255, 0, 255) if self.ball.scale_factor > 1 else (0, 255, 255)
-                    pygame.draw.circle(self.screen, color, center, int(scaled_radius + 5 * self.camera.zoom), 2)
-
-            self.draw_ui()
-            pygame.display.flip()
+            dirty += self.draw_ui()
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                # Push both where things were last frame and where they are now
+                pygame.display.update(previous_dirty + dirty)
+            previous_dirty = dirty
             self.clock.tick(60)
 
         pygame.quit()
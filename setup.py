@@ -0,0 +1,13 @@
+"""Builds the optional compiled MatrixMath extension.
+
+    python setup.py build_ext --inplace
+
+main.py runs without it and falls back to the pure-Python MatrixMath.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="red-ball-game",
+    ext_modules=cythonize("_matrixmath.pyx", language_level=3),
+)